@@ -2,7 +2,7 @@
 import logging
 from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta, timezone
-from functools import lru_cache, reduce
+from functools import lru_cache
 from itertools import chain, product
 from operator import attrgetter
 from pathlib import Path
@@ -10,14 +10,14 @@ from typing import Iterator
 
 import attr
 import click
-from ruamel import yaml
 
 from .. import RESOURCE_ID, configuration, rpm, util
-from ..configuration._loading import load_matching_configuration
+from ..configuration._loading import CACHE_DIR, load_matching_configuration
 from ..exception import UserError
 from ..service.abc import BuildFailure
 from ..service.jenkins import UnknownJob
 from .tooling import SCL, Package, PackageStream, stream_generator, stream_processor
+from .tooling import yaml_dumper
 
 # Logging setup
 logger = logging.getLogger(RESOURCE_ID)
@@ -85,16 +85,19 @@ def main(context, source, destination, **_options):
     log = logger.getChild("main_setup")
 
     # Load configured phases
-    phase = configuration.phase.validate(load_matching_configuration("*.phase.toml"))
+    phase = configuration.phase.validate(
+        load_matching_configuration("*.phase.toml", cache_dir=CACHE_DIR)
+    )
 
     # Load service configuration
-    service_conf = configuration.service.validate(
-        load_matching_configuration("*.service.toml")
+    service_configuration = configuration.service.validate(
+        load_matching_configuration("*.service.toml", cache_dir=CACHE_DIR)
     )
-    service = {
-        name: configuration.service.make_instance(conf)
-        for name, conf in service_conf.items()
-    }
+
+    # Instantiate only the services actually used by the selected phases
+    @lru_cache(maxsize=None)
+    def service(name: str):
+        return configuration.service.make_instance(service_configuration[name])
 
     # Fill configuration dictionary
     context.obj = load_matching_configuration("config.toml")
@@ -107,14 +110,16 @@ def main(context, source, destination, **_options):
             message = "Unknown phase: {!s}".format(err)
             raise ConfigurationMismatch(message) from None
 
-        try:
-            for kind in skeleton.values():
-                kind["service"] = service[kind["service"]]
-        except KeyError as err:
-            message = "Unknown service: {!s}".format(err)
-            raise ConfigurationMismatch(message) from None
+        for kind in skeleton.values():
+            if kind["service"] not in service_configuration:
+                message = "Unknown service: {!r}".format(kind["service"])
+                raise ConfigurationMismatch(message)
 
-        return skeleton
+        # Fresh copies, so that the phase configuration is never modified
+        return {
+            name: dict(kind, service=service(kind["service"]))
+            for name, kind in skeleton.items()
+        }
 
     if source is not None:
         context.obj["source"] = extract_services(source)
@@ -177,7 +182,9 @@ def run_chain(
         package_stream = PackageStream(Package(scl=scl) for scl in collections)
 
     # Apply the processors
-    pipeline = reduce(lambda data, proc: proc(data), processor_seq, package_stream)
+    pipeline = package_stream
+    for processor in processor_seq:
+        pipeline = processor(pipeline)
 
     # Output the results in YAML format
     PackageStream.consume(pipeline).to_yaml(stream=report)
@@ -212,8 +219,28 @@ def diff(package_stream, min_days, simple_dist):
         else:
             return builds
 
-    def obsolete(package, target_map):
-        return package.name in target_map and target_map[package.name] >= package
+    def missing_builds(source_builds, destination_builds):
+        """Select source builds that are not obsoleted by any destination build.
+
+        Both build sequences are sorted by name and walked in parallel,
+        so no lookup table of the destination builds is needed.
+        """
+
+        by_name = attrgetter("name")
+        destination = sorted(destination_builds, key=by_name)
+        start, end = 0, len(destination)
+
+        for build in sorted(set(source_builds), key=by_name):
+            while start < end and destination[start].name < build.name:
+                start += 1
+
+            index = start
+            while index < end and destination[index].name == build.name:
+                if destination[index] >= build:
+                    break  # obsoleted
+                index += 1
+            else:
+                yield build
 
     def old_enough(package, source_map):
         # Skip this check if not explicitly requested
@@ -237,10 +264,18 @@ def diff(package_stream, min_days, simple_dist):
         entry_time = max(filter(None, entry_times), default=now)
         return (now - entry_time) >= timedelta(days=min_days)
 
-    def has_collection_prefix(build, collection):
-        """The package name indicates that it is the part of the collection"""
+    def collection_member(collection):
+        """Create a predicate for packages that are part of the collection."""
+
+        prefix = collection + "-"
+
+        def is_member(build):
+            """The package name indicates that it is the part of the collection"""
 
-        return build.name == collection or build.name.startswith(collection + "-")
+            name = build.name
+            return name == collection or name.startswith(prefix)
+
+        return is_member
 
     # SCL processing
     for pkg in package_stream:
@@ -250,19 +285,11 @@ def diff(package_stream, min_days, simple_dist):
 
             log.info("Comparing {s.collection}-el{s.el}".format(s=pkg.scl))
 
-            # Packages present in destination
-            present = {
-                build.name: build
-                for build in destination_builds
-                if has_collection_prefix(build, pkg.scl.collection)
-            }
+            is_member = collection_member(pkg.scl.collection)
 
-            missing = {
-                build
-                for build in source_builds
-                if has_collection_prefix(build, pkg.scl.collection)
-                and not obsolete(build, present)
-            }
+            missing = missing_builds(
+                filter(is_member, source_builds), filter(is_member, destination_builds)
+            )
 
             ready = filter(lambda build: old_enough(build, pkg.source), missing)
 
@@ -288,12 +315,17 @@ def download(package_stream, output_dir):
     log = logger.getChild("download")
     output_dir = Path(output_dir).resolve()
 
+    # Shared by all downloads, so that open connections are reused
+    session = util.default_requests_session()
+
     for pkg in package_stream:
         collection_dir = output_dir / pkg.scl.collection
         collection_dir.mkdir(exist_ok=True)
 
         log.info("Fetching {}".format(pkg.metadata))
-        local = pkg.source["service"].download(pkg.metadata, collection_dir)
+        local = pkg.source["service"].download(
+            pkg.metadata, collection_dir, session=session
+        )
 
         yield attr.evolve(pkg, metadata=local)
 
@@ -340,7 +372,14 @@ def build(package_stream, fail_file):
     if fail_file is None:
         fail_file = click.get_text_stream("stderr", encoding="utf-8")
 
-    yaml.dump(readable_failures, stream=fail_file, default_flow_style=False)
+    from ruamel import yaml
+
+    yaml.dump(
+        readable_failures,
+        stream=fail_file,
+        Dumper=yaml_dumper(),
+        default_flow_style=False,
+    )
 
 
 @main.command()
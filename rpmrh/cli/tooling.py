@@ -1,27 +1,54 @@
 """Additional CLI-specific tooling"""
 
 import logging
-from collections import defaultdict
-from copy import deepcopy
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 from itertools import groupby
-from operator import attrgetter, itemgetter
-from typing import Iterator, Optional, Union
+from operator import attrgetter
+from typing import Iterable, Iterator, Optional, Union
 from typing import Mapping, TextIO, Callable
 
 import attr
 import click
-from ruamel import yaml
-from attr.validators import optional, instance_of
+from attr.validators import instance_of
 
 from .. import rpm
 
 
 LOG = logging.getLogger(__name__)
 
-# Add YAML dump capabilities for python types not supported by default
-YAMLDumper = deepcopy(yaml.SafeDumper)
-YAMLDumper.add_representer(defaultdict, lambda r, d: r.represent_dict(d))
+# YAML support is imported on first use, as it is not needed by every command
+
+
+def yaml_dumper() -> type:
+    """Provide YAML dumper, backed by libyaml when available."""
+
+    from ruamel import yaml
+
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _load_yaml(string_or_stream: Union[str, TextIO]):
+    """Load YAML document, preferring the fast loader.
+
+    libyaml implements YAML 1.1, and rejects some YAML 1.2 documents
+    (i.e. plain scalars with colons in flow collections)
+    produced by the pure-Python dumper.
+    Such documents are re-read by the pure-Python loader.
+    """
+
+    from ruamel import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    if not isinstance(string_or_stream, str):
+        string_or_stream = string_or_stream.read()
+
+    try:
+        return yaml.load(string_or_stream, Loader=loader)
+    except yaml.YAMLError:
+        if loader is yaml.SafeLoader:
+            raise
+        return yaml.load(string_or_stream, Loader=yaml.SafeLoader)
 
 
 #
@@ -41,10 +68,14 @@ class SCL:
 
 @attr.s(slots=True, frozen=True)
 class Package:
-    """Metadata and context of processed package"""
+    """Metadata and context of processed package
+
+    Packages are created in large numbers by internal code only,
+    so the attributes are not validated.
+    """
 
     #: Data of the associated collection
-    scl = attr.ib(validator=instance_of(SCL))
+    scl = attr.ib()
 
     #: RPM metadata of the package
     metadata = attr.ib(default=None)
@@ -53,26 +84,28 @@ class Package:
     # they are properties of COMMAND, not package
 
     #: The source group for this package
-    source = attr.ib(default=None, validator=optional(instance_of(Mapping)), cmp=False)
+    source = attr.ib(default=None, cmp=False)
     #: The destination group for this package
-    destination = attr.ib(
-        default=None, validator=optional(instance_of(Mapping)), cmp=False
-    )
+    destination = attr.ib(default=None, cmp=False)
+
+
+def _sorted_unique(iterable: Iterable) -> tuple:
+    """Sort the items and remove any duplicates."""
+
+    return tuple(sorted(set(iterable)))
 
 
 @attr.s(slots=True, frozen=True)
 class PackageStream:
     """Encapsulation of stream of processed packages."""
 
-    #: Internal storage for the packages
-    _container = attr.ib(
-        default=frozenset(), validator=instance_of(frozenset), converter=frozenset
-    )
+    #: Internal storage for the packages, sorted and de-duplicated
+    _container = attr.ib(default=(), converter=_sorted_unique)
 
     def __iter__(self):
         """Iterate over the packages in deterministic manner."""
 
-        yield from sorted(self._container)
+        return iter(self._container)
 
     @classmethod
     def consume(cls, iterator: Iterator[Package]):
@@ -85,14 +118,26 @@ class PackageStream:
 
         Keyword arguments:
             stream: The file stream to write the result into.
+
+        Returns:
+            The serialized document if no stream was provided, None otherwise.
         """
 
-        structure = defaultdict(lambda: defaultdict(list))
+        structure = {}
 
-        for pkg in sorted(self._container):
-            structure[pkg.scl.el][pkg.scl.collection].append(str(pkg.metadata))
+        # The container is sorted, so packages of each SCL are adjacent
+        for scl, package_iter in groupby(self._container, attrgetter("scl")):
+            collection_map = structure.setdefault(scl.el, {})
+            collection_map[scl.collection] = [str(p.metadata) for p in package_iter]
 
-        return yaml.dump(structure, stream, Dumper=YAMLDumper)
+        # Emit the whole document at once, then write it in a single call
+        from ruamel import yaml
+
+        document = yaml.dump(structure, Dumper=yaml_dumper())
+        if stream is None:
+            return document
+
+        stream.write(document)
 
     @classmethod
     def from_yaml(cls, structure_or_stream: Union[Mapping, TextIO]):
@@ -112,15 +157,20 @@ class PackageStream:
         if isinstance(structure_or_stream, Mapping):
             structure = structure_or_stream
         else:
-            structure = yaml.safe_load(structure_or_stream)
+            structure = _load_yaml(structure_or_stream)
 
-        return cls(
-            Package(
-                metadata=rpm.Metadata.from_nevra(nevra),
-                scl=SCL(collection=collection, el=el),
-            )
+        # Bind repeatedly used callables locally
+        package, from_nevra = Package, rpm.Metadata.from_nevra
+
+        scl_iter = (
+            (SCL(collection=collection, el=el), pkg_list)
             for el, collection_map in structure.items()
             for collection, pkg_list in collection_map.items()
+        )
+
+        return cls(
+            package(scl, from_nevra(nevra))
+            for scl, pkg_list in scl_iter
             for nevra in pkg_list
         )
 
@@ -153,6 +203,8 @@ def stream_processor(command: Optional[Callable] = None, **option_kind) -> Calla
         1. Ensure that proper service kind exists and attach it to the package.
         2. Expand all format strings with information about current SCL.
 
+        Both are resolved only once for each SCL.
+
         Arguments:
             context: Current context, injected by Click.
 
@@ -170,27 +222,39 @@ def stream_processor(command: Optional[Callable] = None, **option_kind) -> Calla
             )
         )
 
-        def locate_service(package: Package) -> Package:
-            """Attach appropriate services to the package."""
+        @lru_cache(maxsize=None)
+        def resolve_groups(scl: SCL) -> Mapping[str, Mapping]:
+            """Attach appropriate services and expand format strings for an SCL.
+
+            The result is shared by all packages of the SCL
+            and must not be modified.
+            """
+
+            format_map = {"el": scl.el, "collection": scl.collection}
+            groups = {}
 
             # 'source': configuration['source']['repo']
-            services = {
-                key: configuration[key][kind].copy()
-                for key, kind in option_kind.items()
-            }
+            for key, kind in option_kind.items():
+                group = configuration[key][kind].copy()
+                for label_key in group.keys() & {"tags", "targets", "tests"}:
+                    group[label_key] = [
+                        l.format_map(format_map) for l in group[label_key]
+                    ]
+                groups[key] = group
 
-            return attr.evolve(package, **services)
+            return groups
 
-        def format_labels(package: Package) -> Package:
-            """Process all format strings."""
+        def expand_groups(package: Package) -> Package:
+            """Attach the resolved service groups to the package."""
 
-            for group in filter(None, (package.source, package.destination)):
-                for key in group.keys() & {"tags", "targets", "tests"}:
-                    group[key] = [
-                        l.format_map(attr.asdict(package.scl)) for l in group[key]
-                    ]
+            groups = resolve_groups(package.scl)
 
-            return package
+            return Package(
+                scl=package.scl,
+                metadata=package.metadata,
+                source=groups.get("source", package.source),
+                destination=groups.get("destination", package.destination),
+            )
 
         # This changes
         @wraps(command)
@@ -207,8 +271,7 @@ def stream_processor(command: Optional[Callable] = None, **option_kind) -> Calla
             """
 
             # Transform the stream using the prepared operations
-            stream = map(locate_service, stream)
-            stream = map(format_labels, stream)
+            stream = map(expand_groups, stream)
 
             return context.invoke(command, stream, *command_args, **command_kwargs)
 
@@ -241,14 +304,18 @@ def stream_generator(command: Callable = None, **option_kind):
         # Obtain the processor
         processor = stream_processor(command, **option_kind)(*args, **kwargs)
 
+        def placeholders(stream: Iterator[Package]) -> Iterator[Package]:
+            """Group the packages by SCL, discard metadata."""
+
+            last_scl = None
+            for package in stream:
+                if package.scl != last_scl:
+                    last_scl = package.scl
+                    yield Package(scl=last_scl)
+
         @wraps(command)
         def generator(stream: Iterator[Package]) -> Iterator[Package]:
-            # Group the packages, discard metadata
-            groupings = groupby(stream, attrgetter("scl"))
-            keys = map(itemgetter(0), groupings)
-            placeholders = (Package(scl=scl) for scl in keys)
-
-            return processor(placeholders)
+            return processor(placeholders(stream))
 
         return generator
 
@@ -1,22 +1,46 @@
 """Loading of configuration files from package and file system"""
 
 import fnmatch
-from collections import ChainMap
-from contextlib import ExitStack
+import os
+import pickle
+import re
+from functools import lru_cache
+from hashlib import blake2b
 from io import TextIOWrapper
 from itertools import chain
-from typing import Callable, Iterator, Mapping, Optional, Sequence, TextIO
+from tempfile import NamedTemporaryFile
+from typing import Any, Callable, Iterator, List, Mapping, Match, Optional, Sequence
+from typing import TextIO
 from pathlib import Path
 from pkg_resources import resource_listdir, resource_stream
 
-import toml
-from xdg.BaseDirectory import load_config_paths
+from xdg.BaseDirectory import load_config_paths, xdg_cache_home
 
 from .. import RESOURCE_ID
 
+# Both parsers are pure Python; tomllib (Python 3.11+) is the faster one.
+# The toml package returns its own (unpicklable) types for inline tables,
+# while tomllib produces only built-in dict and list.
+try:
+    from tomllib import loads as parse_toml
+except ImportError:
+    from toml import loads as parse_toml
+
 #: Path from package root to bundled configuration
 RESOURCE_ROOT_DIR = "conf.d"
 
+#: Directory for caching of interpreted configuration
+CACHE_DIR = Path(xdg_cache_home, RESOURCE_ID)
+#: Version of the cache file format; change it to invalidate existing caches
+CACHE_FORMAT_VERSION = 2
+
+
+@lru_cache(maxsize=32)
+def _glob_matcher(glob: str) -> Callable[[str], Optional[Match]]:
+    """Compile a file name glob into a matching function."""
+
+    return re.compile(fnmatch.translate(glob)).match
+
 
 def open_matching_resources(
     glob: str,
@@ -37,10 +61,9 @@ def open_matching_resources(
         Open streams for found resources. It is the caller responsibility to close them.
     """
 
-    candidate_list = resource_listdir(package, root_dir)
-    match_iter = fnmatch.filter(candidate_list, glob)
+    matches = _glob_matcher(glob)
 
-    for name in match_iter:
+    for name in filter(matches, resource_listdir(package, root_dir)):
         path = "/".join((root_dir, name))
         binary_stream = resource_stream(package, path)
 
@@ -68,15 +91,175 @@ def open_matching_files(
     if search_path_seq is None:
         search_path_seq = list(map(Path, load_config_paths(RESOURCE_ID)))
 
-    match_iter = chain.from_iterable(
-        directory.glob(glob) for directory in search_path_seq
-    )
-    yield from (match.open(encoding=encoding) for match in match_iter)
+    matches = _glob_matcher(glob)
+
+    for directory in map(os.fspath, search_path_seq):
+        # Single directory scan; entry types are usually known without stat
+        try:
+            with os.scandir(directory) as entry_iter:
+                name_list = [entry.name for entry in entry_iter if entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+        for name in filter(matches, name_list):
+            yield open(os.path.join(directory, name), encoding=encoding)
+
+
+def load_toml(stream: TextIO) -> Mapping:
+    """Interpret a TOML-formatted stream.
+
+    Keyword arguments:
+        stream: The stream to read the data from.
+
+    Returns:
+        The interpreted data.
+    """
+
+    return parse_toml(stream.read())
+
+
+def _cache_path(
+    cache_dir: Path, glob: str, interpret: Callable[[TextIO], Mapping]
+) -> Path:
+    """Determine the cache file path for configuration loaded by a glob.
+
+    Each glob and interpretation has a single cache file,
+    which is overwritten when the configuration changes.
+
+    Keyword arguments:
+        cache_dir: The directory to store the cache files in.
+        glob: The glob used to find the configuration.
+        interpret: The converter used for the configuration.
+
+    Returns:
+        Path to the cache file.
+    """
+
+    interpret_id = "{0.__module__}.{0.__qualname__}".format(interpret)
+    name = repr((glob, interpret_id))
+    digest = blake2b(name.encode("utf-8"), digest_size=16).hexdigest()
+
+    return cache_dir / "configuration-{}.pickle".format(digest)
+
+
+def _cache_key(stream_seq: Sequence[TextIO]) -> Optional[str]:
+    """Identify the state of a set of configuration streams.
+
+    The key is derived from the name, modification time and size
+    of each stream, so any change to the configuration files
+    results in a different key.
+
+    Keyword arguments:
+        stream_seq: The configuration streams to identify.
+
+    Returns:
+        The identification key, or None if any of the streams
+        cannot be identified (i.e. is not backed by a file).
+    """
+
+    key_seq = []
+    for stream in stream_seq:
+        try:
+            status = os.fstat(stream.fileno())
+        except (AttributeError, OSError, ValueError):
+            return None
+        key_seq.append((stream.name, status.st_mtime_ns, status.st_size))
+
+    return repr(key_seq)
+
+
+def _read_cache(path: Path, key: str) -> Optional[List[Mapping]]:
+    """Read cached configuration data.
+
+    Keyword arguments:
+        path: The cache file to read.
+        key: The expected identification of the configuration streams.
+
+    Returns:
+        The cached data, or None if the cache is missing, unusable
+        or stored for a different key.
+    """
+
+    try:
+        with path.open(mode="rb") as istream:
+            version, stored_key, data_list = pickle.load(istream)
+    except Exception:  # missing, corrupted or otherwise unusable cache
+        return None
+
+    if version != CACHE_FORMAT_VERSION or stored_key != key:
+        return None
+
+    return data_list
+
+
+def _plain(data: Any) -> Any:
+    """Convert interpreted data to plain built-in containers.
+
+    Some parsers (i.e. the toml package) produce mapping types
+    that cannot be pickled.
+
+    Keyword arguments:
+        data: The data to convert.
+
+    Returns:
+        Equivalent data, with mappings as dict and sequences as list.
+    """
+
+    if isinstance(data, Mapping):
+        return {key: _plain(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_plain(item) for item in data]
+    return data
+
+
+def _write_cache(path: Path, key: str, data_list: List[Mapping]) -> None:
+    """Atomically store configuration data into a cache file.
+
+    Failure to write the cache is not an error; the data are just not cached.
+
+    Keyword arguments:
+        path: The cache file to write.
+        key: The identification of the configuration streams.
+        data_list: The data to store.
+    """
+
+    temporary_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(dir=str(path.parent), delete=False) as ostream:
+            temporary_name = ostream.name
+            pickle.dump((CACHE_FORMAT_VERSION, key, _plain(data_list)), ostream)
+        os.replace(temporary_name, str(path))
+    except Exception:  # the cache is best-effort only, never fail the loading
+        if temporary_name is not None:
+            try:
+                os.unlink(temporary_name)
+            except OSError:
+                pass
+
+
+def _merge(data_list: Sequence[Mapping]) -> dict:
+    """Merge top-level keys of the data, with earlier entries taking precedence.
+
+    Keyword arguments:
+        data_list: The data to merge, from the most specific one.
+
+    Returns:
+        New dictionary with the merged data.
+    """
+
+    merged = {}
+    for data in reversed(data_list):
+        merged.update(data)
+    return merged
 
 
 def load_matching_configuration(
-    glob: str, *, interpret: Callable[[TextIO], Mapping] = toml.load
-) -> ChainMap:
+    glob: str,
+    *,
+    interpret: Callable[[TextIO], Mapping] = load_toml,
+    cache_dir: Optional[Path] = None,
+) -> dict:
     """Load configuration from all matching files/resources.
 
     The configuration is merged to single Mapping, with specific configuration
@@ -85,15 +268,36 @@ def load_matching_configuration(
     Keyword arguments:
         glob: The glob describing the configuration files/resources to open.
         interpret: Converter from text to Python data types.
+        cache_dir: If not None, the interpreted data are cached in this
+            directory, and re-used while the matching files do not change.
 
     Returns:
-        Configuration data merged into single ChainMap.
+        Configuration data merged into single dictionary.
     """
 
-    with ExitStack() as to_close:
+    stream_list = []
+    try:
         file_iter = open_matching_files(glob)
         resource_iter = open_matching_resources(glob)
-        stream_iter = map(to_close.enter_context, chain(file_iter, resource_iter))
-        data_iter = map(interpret, stream_iter)
+        stream_list.extend(chain(file_iter, resource_iter))
+
+        cache_key = None
+        if cache_dir is not None:
+            cache_key = _cache_key(stream_list)
+
+        if cache_key is not None:
+            cache_path = _cache_path(cache_dir, glob, interpret)
+            data_list = _read_cache(cache_path, cache_key)
+            if data_list is not None:
+                return _merge(data_list)
+
+        data_list = [interpret(stream) for stream in stream_list]
+
+        if cache_key is not None:
+            _write_cache(cache_path, cache_key, data_list)
+
+        return _merge(data_list)
 
-        return ChainMap(*data_iter)
+    finally:
+        for stream in stream_list:
+            stream.close()
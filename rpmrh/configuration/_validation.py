@@ -1,7 +1,7 @@
 """Common validation routines for configuration files"""
 
 import warnings
-from typing import Mapping, Optional
+from typing import Dict, Mapping, Optional, Tuple
 
 from ..exception import UserError
 
@@ -20,6 +20,27 @@ class InvalidConfiguration(UserError):
     lead = "Configuration error"
 
 
+#: Validators for already used schemas, keyed by schema identity
+_VALIDATOR_CACHE: Dict[int, Tuple[Mapping, "cerberus.Validator"]] = {}
+
+
+def _validator(schema: Mapping) -> "cerberus.Validator":
+    """Provide a validator for the schema.
+
+    The schema is compiled only on first use;
+    afterwards, the same validator is reused.
+    """
+
+    cached_schema, validator = _VALIDATOR_CACHE.get(id(schema), (None, None))
+    if cached_schema is schema:
+        return validator
+
+    validator = cerberus.Validator(schema=schema)
+    # Keep the schema alive, so that its id is not reused
+    _VALIDATOR_CACHE[id(schema)] = schema, validator
+    return validator
+
+
 def validate(
     configuration_map: Mapping, *, schema: Mapping, top_level: Optional[str] = None
 ) -> dict:
@@ -45,7 +66,7 @@ def validate(
         InvalidConfiguration: configuration_map did not pass the validation.
     """
 
-    validator = cerberus.Validator(schema=schema)
+    validator = _validator(schema)
 
     # No hack is needed
     if top_level is None:
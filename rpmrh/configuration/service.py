@@ -63,11 +63,7 @@ def register(
     def decorator(cls: Type) -> Type:
         """Insert the type in the registry."""
 
-        if initializer:
-            registry[name] = getattr(cls, initializer)
-        else:
-            registry[name] = cls
-
+        registry[name] = getattr(cls, initializer) if initializer else cls
         return cls
 
     return decorator
@@ -88,9 +84,11 @@ def make_instance(configuration_map: Mapping, *, registry: Mapping = KNOWN_TYPES
         KeyError: Requested type is missing from registry.
     """
 
-    configuration_map = dict(configuration_map)
-    type_name = configuration_map.pop("type")
-    return registry[type_name](**configuration_map)
+    initializer = registry[configuration_map["type"]]
+    arguments = {
+        key: value for key, value in configuration_map.items() if key != "type"
+    }
+    return initializer(**arguments)
 
 
 def make_instance_map(
@@ -1,14 +1,12 @@
 """RPM-related classes and procedures."""
-import operator
 import re
-from functools import partialmethod
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
-from typing import Callable
 from typing import ClassVar
 from typing import Tuple
 from typing import Union
-from typing import cast
 
 import attr
 from attr.validators import instance_of
@@ -18,7 +16,7 @@ from .util import system_import
 _rpm = system_import("rpm")
 
 # type aliases and helpers
-CompareOperator = Callable[[Any, Any], bool]
+Label = Tuple[str, str, str]
 
 
 # .el7_4 format
@@ -56,32 +54,111 @@ def _normalize_path(path: Union[str, Path]) -> Path:
     return Path(path).resolve()
 
 
+# Comparison helpers
+@lru_cache(maxsize=4096)
+def _label_compare(first: Label, second: Label) -> int:
+    """Compare two RPM labels, remembering the results.
+
+    Sorting compares the same few labels repeatedly,
+    so the relatively expensive call to RPM is made only once for each pair.
+    """
+
+    return _rpm.labelCompare(first, second)
+
+
+#: Query format for reading metadata from a package header, one field per line
+_HEADER_FORMAT = "%{NAME}\n%{VERSION}\n%{RELEASE}\n%{EPOCHNUM}\n%{ARCH}"
+
+#: Per-thread state of the RPM library
+_THREAD_STATE = threading.local()
+
+
+def _transaction_set() -> "_rpm.TransactionSet":
+    """Provide a transaction set for reading package headers.
+
+    The set is created once for each thread, and then reused.
+    """
+
+    try:
+        return _THREAD_STATE.transaction_set
+    except AttributeError:
+        transaction = _rpm.TransactionSet()
+        # Ignore missing signatures warning
+        transaction.setVSFlags(_rpm._RPMVSF_NOSIGNATURES)
+
+        _THREAD_STATE.transaction_set = transaction
+        return transaction
+
+
+@lru_cache(maxsize=1024)
+def _read_metadata(path: Path, mtime_ns: int, size: int) -> "Metadata":
+    """Read metadata from an RPM file header.
+
+    The results are remembered, so that the same unchanged file
+    is never parsed twice.
+
+    Keyword arguments:
+        path: The path to the RPM file.
+        mtime_ns: Modification time of the file; part of the cache key.
+        size: Size of the file; part of the cache key.
+
+    Returns:
+        New instance of Metadata.
+    """
+
+    with path.open(mode="rb") as file:
+        header = _transaction_set().hdrFromFdno(file.fileno())
+
+    # Extract all the textual fields at once
+    fields = _ensure_text(header.sprintf(_HEADER_FORMAT)).split("\n")
+    metadata = dict(zip(("name", "version", "release", "epoch", "arch"), fields))
+
+    # For source RPMs the architecture reported is a binary one
+    # for some reason
+    if header[_rpm.RPMTAG_SOURCEPACKAGE]:
+        metadata["arch"] = "src"
+
+    return Metadata(**metadata)
+
+
 def _ensure_text(data: Union[str, bytes], *, encoding: str = "utf-8") -> str:
     """Decode input data into Unicode string if necessary"""
 
     return data.decode(encoding) if isinstance(data, bytes) else data
 
 
-@attr.s(slots=True, cmp=False, frozen=True, hash=True)
-class Metadata:
+class _DerivedValues:
+    """Storage for values derived from the Metadata attributes.
+
+    The values are kept out of the attrs fields,
+    so that they are neither reported by attr.asdict(),
+    nor stored when pickling.
+    """
+
+    __slots__ = (
+        "_label",  # RPM label, for comparisons
+        "_hash",  # hash value, valid only in the current process
+    )
+
+
+@attr.s(slots=True, cmp=False, frozen=True, hash=False)  # see __hash__
+class Metadata(_DerivedValues):
     """Generic RPM metadata.
 
     This class should act as a basis for all the RPM-like objects,
     providing common comparison and other "dunder" methods.
     """
 
-    #: Regular expression for extracting epoch from an NEVRA string
-    _EPOCH_RE: ClassVar = re.compile(r"(\d+):")
-    #: Regular expression for splitting up NVR string
-    _NVRA_RE: ClassVar = re.compile(
+    #: Regular expression for splitting up NEVRA string; use with fullmatch()
+    _NEVRA_RE: ClassVar = re.compile(
         r"""
-        ^
+        (?:(?P<leading_epoch>\d+):)?  # optional epoch in front of the name
         (?P<name>\S+)-          # package name
+        (?:(?P<epoch>\d+):)?    # optional package epoch
         (?P<version>[\w.]+)-    # package version
         (?P<release>\w+(?:\.[\w+]+)+?)  # package release, with required dist tag
         (?:\.(?P<arch>\w+))?    # optional package architecture
         (?:\.rpm)?              # optional rpm extension
-        $
         """,
         flags=re.VERBOSE,
     )
@@ -93,10 +170,8 @@ class Metadata:
     #: RPM release
     release: str = attr.ib(validator=instance_of(str))
 
-    #: Optional RPM epoch
-    epoch: int = attr.ib(
-        validator=instance_of(int), default=_DEFAULT_EPOCH, converter=_normalize_epoch
-    )
+    #: Optional RPM epoch; the converter always produces an int
+    epoch: int = attr.ib(default=_DEFAULT_EPOCH, converter=_normalize_epoch)
 
     #: RPM architecture
     arch: str = attr.ib(
@@ -105,6 +180,15 @@ class Metadata:
         converter=_normalize_architecture,
     )
 
+    def __attrs_post_init__(self):
+        """Compute the values derived from the attributes."""
+
+        label = (str(self.epoch), self.version, self.release)
+        object.__setattr__(self, "_label", label)
+
+        identity = (self.name, self.version, self.release, self.epoch, self.arch)
+        object.__setattr__(self, "_hash", hash(identity))
+
     # Alternative constructors
 
     @classmethod
@@ -121,28 +205,22 @@ class Metadata:
             ValueError: The :ref:`nevra` argument is not valid NEVRA string.
         """
 
-        arguments = {}
-
-        # Extract the epoch, if present
-        def replace_epoch(match):
-            arguments["epoch"] = match.group(1)
-            return ""
-
-        nvra = cls._EPOCH_RE.sub(replace_epoch, nevra, count=1)
-
-        # Parse the rest of the string
-        match = cls._NVRA_RE.match(nvra)
+        match = cls._NEVRA_RE.fullmatch(nevra)
         if not match:
             message = "Invalid NEVRA string: {}".format(nevra)
             raise ValueError(message)
 
-        arguments.update(
-            (name, value)
-            for name, value in match.groupdict().items()
-            if value is not None
-        )
+        leading_epoch, name, epoch, version, release, arch = match.groups()
 
-        return cls(**arguments)
+        # The epoch is accepted in front of the name as well, but only once;
+        # missing values (None) are normalized by the attribute converters
+        if leading_epoch is not None:
+            if epoch is not None:
+                message = "Conflicting epochs in NEVRA string: {}".format(nevra)
+                raise ValueError(message)
+            epoch = leading_epoch
+
+        return cls(name, version, release, epoch, arch)
 
     # Derived attributes
 
@@ -150,59 +228,90 @@ class Metadata:
     def nvr(self) -> str:
         """:samp:`{name}-{version}-{release}` string of the RPM object"""
 
-        return "{s.name}-{s.version}-{s.release}".format(s=self)
+        return f"{self.name}-{self.version}-{self.release}"
 
     @property
     def nevra(self) -> str:
         """:samp:`{name}-{epoch}:{version}-{release}.{arch}` string of the RPM object"""
 
-        return "{s.name}-{s.epoch}:{s.version}-{s.release}.{s.arch}".format(s=self)
+        return f"{self.name}-{self.epoch}:{self.version}-{self.release}.{self.arch}"
 
     @property
-    def label(self) -> Tuple[str, str, str]:
+    def label(self) -> Label:
         """Label compatible with RPM's C API."""
 
-        return (str(self.epoch), self.version, self.release)
+        return self._label
 
     @property
     def canonical_file_name(self):
         """Canonical base file name of a package with this metadata."""
 
-        if self.epoch:
-            format = "{s.name}-{s.epoch}:{s.version}-{s.release}.{s.arch}.rpm"
-        else:
-            format = "{s.name}-{s.version}-{s.release}.{s.arch}.rpm"
+        epoch = f"{self.epoch}:" if self.epoch else ""
 
-        return format.format(s=self)
+        return f"{self.name}-{epoch}{self.version}-{self.release}.{self.arch}.rpm"
 
     # Comparison methods
-    def _compare(self, other: "Metadata", oper: CompareOperator) -> bool:
-        """Generic comparison of two RPM-like objects.
+    def _compare(self, other: "Metadata") -> int:
+        """Three-way comparison of two RPM-like objects.
 
         Keyword arguments:
-            other: The object to compare with
-            oper: The operator to use for the comparison.
+            other: The object to compare with.
 
         Returns:
-            bool: The result of the comparison.
+            int: Negative, zero or positive number if self is
+                lesser than, equal to or greater than other, respectively.
             NotImplemented: Incompatible operands.
         """
 
         try:
-            if self.name == other.name:
-                return oper(_rpm.labelCompare(self.label, other.label), 0)
-            else:
-                return oper(self.name, other.name)
+            other_name, other_label = other.name, other._label
+        except AttributeError:
+            return NotImplemented
+
+        if self.name == other_name:
+            return _label_compare(self._label, other_label)
+        else:
+            return -1 if self.name < other_name else 1
 
+    def __eq__(self, other: Any) -> bool:
+        try:
+            if self.name != other.name:
+                return False
+            # Identical labels are equal without asking librpm
+            return (
+                self._label == other._label
+                or _label_compare(self._label, other._label) == 0
+            )
         except AttributeError:
             return NotImplemented
 
-    __eq__ = cast(CompareOperator, partialmethod(_compare, oper=operator.eq))
-    __ne__ = cast(CompareOperator, partialmethod(_compare, oper=operator.ne))
-    __lt__ = cast(CompareOperator, partialmethod(_compare, oper=operator.lt))
-    __le__ = cast(CompareOperator, partialmethod(_compare, oper=operator.le))
-    __gt__ = cast(CompareOperator, partialmethod(_compare, oper=operator.gt))
-    __ge__ = cast(CompareOperator, partialmethod(_compare, oper=operator.ge))
+    def __ne__(self, other: Any) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __lt__(self, other: Any) -> bool:
+        result = self._compare(other)
+        return result if result is NotImplemented else result < 0
+
+    def __le__(self, other: Any) -> bool:
+        result = self._compare(other)
+        return result if result is NotImplemented else result <= 0
+
+    def __gt__(self, other: Any) -> bool:
+        result = self._compare(other)
+        return result if result is NotImplemented else result > 0
+
+    def __ge__(self, other: Any) -> bool:
+        result = self._compare(other)
+        return result if result is NotImplemented else result >= 0
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        """Pickle by the initializer arguments, recomputing the derived values."""
+
+        return type(self), attr.astuple(self, recurse=False)
 
     # String representations
     def __str__(self) -> str:
@@ -243,29 +352,8 @@ class LocalPackage:
             New instance of Metadata.
         """
 
-        transaction = _rpm.TransactionSet()
-        # Ignore missing signatures warning
-        transaction.setVSFlags(_rpm._RPMVSF_NOSIGNATURES)
-
-        with self.path.open(mode="rb") as file:
-            header = transaction.hdrFromFdno(file.fileno())
-
-        # Decode the metadata
-        metadata = {
-            "name": _ensure_text(header[_rpm.RPMTAG_NAME]),
-            "version": _ensure_text(header[_rpm.RPMTAG_VERSION]),
-            "release": _ensure_text(header[_rpm.RPMTAG_RELEASE]),
-            "epoch": header[_rpm.RPMTAG_EPOCHNUM],
-        }
-
-        # For source RPMs the architecture reported is a binary one
-        # for some reason
-        if header[_rpm.RPMTAG_SOURCEPACKAGE]:
-            metadata["arch"] = "src"
-        else:
-            metadata["arch"] = _ensure_text(header[_rpm.RPMTAG_ARCH])
-
-        return Metadata(**metadata)
+        status = self.path.stat()
+        return _read_metadata(self.path, status.st_mtime_ns, status.st_size)
 
     # Path-like protocol
     def __fspath__(self) -> str:
@@ -292,4 +380,8 @@ def shorten_dist_tag(metadata: Metadata) -> Metadata:
         Potentially modified metadata.
     """
 
-    return attr.evolve(metadata, release=LONG_DIST_RE.sub(r"\1", metadata.release))
+    release = LONG_DIST_RE.sub(r"\1", metadata.release)
+    if release == metadata.release:  # already short, no need for a new object
+        return metadata
+
+    return attr.evolve(metadata, release=release)
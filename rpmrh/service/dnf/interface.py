@@ -4,6 +4,7 @@ from typing import Iterable
 from typing import Iterator
 from typing import Mapping
 from typing import Optional
+from typing import Sequence
 from typing import Set
 from typing import TYPE_CHECKING
 
@@ -14,6 +15,7 @@ from attr.validators import instance_of
 from .. import abc
 from ... import rpm
 from ...configuration import service
+from ...util import DOWNLOAD_CHUNK_SIZE
 from ...util import default_requests_session
 from ...util import system_import
 from ._compat import make_compatible
@@ -42,9 +44,13 @@ def convert_metadata(package: DNFPackage) -> rpm.Metadata:
     # of toying with the Adapter pattern is probably for the best.
     # Attempts at a reasonable Adapter implementation welcome :)
 
-    attributes = {a.name for a in attr.fields(rpm.Metadata)}
-
-    return rpm.Metadata(**{a: getattr(package, a) for a in attributes})
+    return rpm.Metadata(
+        name=package.name,
+        version=package.version,
+        release=package.release,
+        epoch=package.epoch,
+        arch=package.arch,
+    )
 
 
 @service.register("dnf", initializer="configured")
@@ -55,6 +61,9 @@ class RepoGroup(abc.Repository):
     #: dnf.Base object managing the group
     base = attr.ib(validator=instance_of(dnf.Base), converter=make_compatible)
 
+    #: IDs of repositories whose packages are currently loaded in the sack
+    _loaded_repos = attr.ib(init=False, default=None, repr=False, cmp=False)
+
     @classmethod
     def configured(cls, repo_configs: Iterable[Mapping]):
         """Create a new instance from repository configurations.
@@ -69,19 +78,43 @@ class RepoGroup(abc.Repository):
         base = dnf.Base()
 
         for config in repo_configs:
-            # Make independent shallow copy for our modification
-            config = dict(config)
-            # Convert arguments to proper API
-            arguments = {
-                "repoid": config.pop("name"),
-                "conf": base.conf,
-                "baseurl": [config.pop("baseurl")],
+            # Pass through all but the keys that need conversion to proper API
+            extra = {
+                key: value
+                for key, value in config.items()
+                if key not in {"name", "baseurl"}
             }
 
-            base.repos.add_new_repo(**arguments, **config)
+            base.repos.add_new_repo(
+                repoid=config["name"],
+                conf=base.conf,
+                baseurl=[config["baseurl"]],
+                **extra,
+            )
 
         return cls(base)
 
+    def _load_repos(self, repo_list: Sequence) -> None:
+        """Load packages of exactly the selected repositories into the sack.
+
+        Filling the sack is expensive, so it is skipped
+        if the same repositories are already loaded.
+
+        Keyword arguments:
+            repo_list: The repositories to load.
+        """
+
+        repo_ids = frozenset(repo.id for repo in repo_list)
+        if repo_ids == self._loaded_repos:
+            return
+
+        self.base.repos.all().disable()
+        for repo in repo_list:
+            repo.enable()
+        self.base.fill_sack(load_system_repo=False)
+
+        object.__setattr__(self, "_loaded_repos", repo_ids)
+
     @property
     def tag_prefixes(self) -> Set[str]:
         """Present the repository IDs as the valid tag prefixes."""
@@ -98,9 +131,7 @@ class RepoGroup(abc.Repository):
             Metadata for all latest builds within the tag.
         """
 
-        self.base.repos.all().disable()
-        self.base.repos.get_matching(tag_name).enable()
-        self.base.fill_sack(load_system_repo=False)
+        self._load_repos(self.base.repos.get_matching(tag_name))
 
         query = self.base.sack.query()
         yield from map(convert_metadata, query.latest())
@@ -125,16 +156,15 @@ class RepoGroup(abc.Repository):
 
         session = default_requests_session(session)
 
-        self.base.repos.all().enable()
-        self.base.fill_sack(load_system_repo=False)
+        self._load_repos(self.base.repos.all())
 
         query = self.base.sack.query()
         candidate, = query.filter(
-            **attr.asdict(
-                package,
-                # filter=attr.filters.include(*attr.fields(rpm.Metadata)),
-                filter=lambda attrib, _val: attrib in attr.fields(rpm.Metadata),
-            )
+            name=package.name,
+            epoch=package.epoch,
+            version=package.version,
+            release=package.release,
+            arch=package.arch,
         )
         source_url = candidate.remote_location()
 
@@ -143,7 +173,6 @@ class RepoGroup(abc.Repository):
 
         target_path = target_dir / source_url.rsplit("/")[-1]
         with target_path.open(mode="wb") as ostream:
-            for chunk in response.iter_content(chunk_size=256):
-                ostream.write(chunk)
+            ostream.writelines(response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE))
 
         return rpm.LocalPackage(target_path)
@@ -110,7 +110,8 @@ class Server:
                 )
             ) from error
 
-        return frozenset(
-            rpm.Metadata.from_nevra(line)
-            for line in response.iter_lines(decode_unicode=True)
-        )
+        # Skip blank lines (i.e. trailing ones) cheaply, before any parsing
+        line_iter = filter(None, util.net.iter_lines(response))
+
+        # Parse directly by the C-level map, without generator frame per line
+        return frozenset(map(rpm.Metadata.from_nevra, line_iter))
@@ -4,13 +4,15 @@ import os
 import time
 from datetime import datetime
 from datetime import timezone
+from functools import lru_cache
 from itertools import groupby
-from itertools import starmap
 from operator import attrgetter
 from operator import itemgetter
 from pathlib import Path
 from typing import AbstractSet
 from typing import Any
+from typing import Dict
+from typing import FrozenSet
 from typing import Iterator
 from typing import Mapping
 from typing import Optional
@@ -25,7 +27,7 @@ from click import style
 from . import abc
 from .. import rpm
 from ..configuration import service
-from ..util import system_import
+from ..util import DOWNLOAD_CHUNK_SIZE, system_import
 
 if TYPE_CHECKING:
     import koji
@@ -35,6 +37,13 @@ else:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _init_field_names(cls: type) -> FrozenSet[str]:
+    """Names of the attributes accepted by the initializer of an attrs class."""
+
+    return frozenset(attribute.name for attribute in attr.fields(cls) if attribute.init)
+
+
 @attr.s(slots=True, frozen=True, cmp=False)
 class BuiltPackage(rpm.Metadata):
     """Data for a built RPM package presented by a Koji service.
@@ -61,9 +70,9 @@ class BuiltPackage(rpm.Metadata):
             New BuiltPackage instance.
         """
 
-        valid_keys = {attribute.name for attribute in attr.fields(cls)}
+        # The raw data usually contain many more keys than the valid ones
         known_data = {
-            key: value for key, value in raw_data.items() if key in valid_keys
+            key: raw_data[key] for key in _init_field_names(cls) if key in raw_data
         }
 
         return cls(**known_data)
@@ -86,8 +95,7 @@ class BuiltPackage(rpm.Metadata):
         if isinstance(original, cls):  # already downcasted
             return original
 
-        raw_data = service.session.getBuild(attr.asdict(original))
-        return cls.from_mapping(raw_data)
+        return service._built_package(original)
 
 
 @service.register("koji", initializer="from_config_profile")
@@ -119,6 +127,11 @@ class Service(abc.Repository, abc.Builder):
         validator=optional(instance_of(str)), default=None
     )
 
+    #: Already fetched builds, by the metadata used for the query
+    _build_cache: Dict[rpm.Metadata, BuiltPackage] = attr.ib(
+        init=False, factory=dict, repr=False, cmp=False
+    )
+
     # Dynamic defaults
 
     @session.default
@@ -178,10 +191,12 @@ class Service(abc.Repository, abc.Builder):
 
         build_list = self.session.listTagged(tag_name)
         build_iter = map(BuiltPackage.from_mapping, build_list)
-        build_groups = groupby(sorted(build_iter), key=attrgetter("name"))
-        latest_iter = starmap(lambda _name, group: max(group), build_groups)
 
-        yield from latest_iter
+        # Only the name is needed for grouping; versions are compared by max()
+        by_name = attrgetter("name")
+        build_groups = groupby(sorted(build_iter, key=by_name), key=by_name)
+
+        yield from (max(group) for _name, group in build_groups)
 
     def tag_entry_time(self, tag_name: str, build: rpm.Metadata) -> Optional[datetime]:
         """Determine the entry time of a build into a tag.
@@ -207,6 +222,27 @@ class Service(abc.Repository, abc.Builder):
         else:
             return datetime.fromtimestamp(timestamp, tz=timezone.utc)
 
+    def _built_package(self, metadata: rpm.Metadata) -> BuiltPackage:
+        """Fetch build data for metadata, remembering the result.
+
+        Builds do not change, so each one is fetched only once.
+
+        Keyword arguments:
+            metadata: The metadata of the build to fetch.
+
+        Returns:
+            The build data.
+        """
+
+        try:
+            return self._build_cache[metadata]
+        except KeyError:
+            pass
+
+        raw_data = self.session.getBuild(attr.asdict(metadata))
+        built = self._build_cache[metadata] = BuiltPackage.from_mapping(raw_data)
+        return built
+
     # Tasks
 
     def download(
@@ -259,8 +295,7 @@ class Service(abc.Repository, abc.Builder):
         response.raise_for_status()
 
         with target_file_path.open(mode="wb") as ostream:
-            for chunk in response.iter_content(chunk_size=256):
-                ostream.write(chunk)
+            ostream.writelines(response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE))
 
         return rpm.LocalPackage(target_file_path)
 
@@ -380,7 +415,8 @@ class Service(abc.Repository, abc.Builder):
 
         Keyword arguments:
             task_id: Numeric identification of the task to watch.
-            poll_interval: Interval (in seconds) of task state queries.
+            poll_interval: Maximal interval (in seconds) of task state queries.
+                The queries start more often, and back off up to this value.
             built_package: Metadata of the package being built
                 (for more informative log messages).
             silent: If True, suppress logging output.
@@ -426,8 +462,10 @@ class Service(abc.Repository, abc.Builder):
         log_state(task_info)
 
         # Wait until finished, log any detected state changes
+        interval = min(1, poll_interval)
         while name_state(task_info) not in END_STATE_SET:
-            time.sleep(poll_interval)
+            time.sleep(interval)
+            interval = min(interval * 1.5, poll_interval)
 
             new_info = self.session.getTaskInfo(task_id)
             if new_info["state"] != task_info["state"]:
@@ -449,8 +487,8 @@ class Service(abc.Repository, abc.Builder):
         Keyword arguments:
             target_name: Name of the target to build into.
             source_package: The package to build.
-            poll_interval: Interval (in seconds) of querying the task state
-                when watching.
+            poll_interval: Maximal interval (in seconds) of querying
+                the task state when watching.
 
         Returns:
             Metadata for a successfully built SRPM package.
@@ -2,4 +2,4 @@
 
 from . import logging  # noqa: F401
 from .importlib import SystemImportError, system_import  # noqa: F401
-from .net import default_requests_session  # noqa: F401
+from .net import DOWNLOAD_CHUNK_SIZE, default_requests_session  # noqa: F401
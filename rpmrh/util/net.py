@@ -1,10 +1,14 @@
 """Utilities for network calls."""
+from typing import Iterator
 from typing import Optional
 from typing import Union
 
 import requests
 from requests_file import FileAdapter
 
+#: Size of the chunks in which downloaded files are read and written
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 
 def default_requests_session(
     session: Optional[requests.Session] = None
@@ -64,3 +68,40 @@ def fetch(
 
     response.encoding = encoding
     return response.text
+
+
+def iter_lines(
+    response: requests.Response,
+    *,
+    encoding: str = "utf-8",
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Iterate over lines of a streamed response.
+
+    Unlike requests.Response.iter_lines, the time spent on a line
+    spanning multiple chunks is linear with its length,
+    and the content is decoded once for all complete lines in a chunk.
+
+    Keyword arguments:
+        response: The response to read the lines from.
+        encoding: The encoding of the response content.
+        chunk_size: Size of the chunks read from the response.
+
+    Yields:
+        Decoded lines, without the line terminators.
+    """
+
+    pending = bytearray()
+
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        end = chunk.rfind(b"\n") + 1
+        if not end:  # no complete line yet
+            pending += chunk
+            continue
+
+        pending += chunk[:end]
+        yield from pending.decode(encoding).splitlines()
+        pending = bytearray(chunk[end:])
+
+    if pending:
+        yield from pending.decode(encoding).splitlines()
@@ -52,6 +52,9 @@ def monkeypatch_pathlib_import(monkeypatch, fs):
         def __getattr__(self, name):
             return getattr(self.__delegate, name)
 
+        def __fspath__(self):
+            return self.__delegate.__fspath__()
+
     monkeypatch.setattr(conf_loading, "Path", PathMock)
 
 
@@ -2,9 +2,11 @@
 
 from collections import namedtuple
 from contextlib import ExitStack
+from pathlib import Path
 
 import pytest
 
+from rpmrh import RESOURCE_ID
 from rpmrh.configuration import _loading as conf_loading
 
 Resource = namedtuple("Resource", ["name", "content"])
@@ -62,3 +64,107 @@ def test_load_configuration_loads_correct_sources(glob, expected_content):
     assert all(
         value == expected_content for value in conf_map.values()
     ), conf_map.values()
+
+
+@pytest.fixture
+def counting_interpret():
+    """Interpret function that records the names of interpreted streams."""
+
+    def interpret(stream):
+        interpret.seen.append(stream.name)
+        return {stream.name: stream.read()}
+
+    interpret.seen = []
+    return interpret
+
+
+@pytest.mark.usefixtures("mock_config_file_stubs")
+def test_load_configuration_reuses_cache(monkeypatch, counting_interpret):
+    """Unchanged configuration files are not interpreted again."""
+
+    monkeypatch.setattr(conf_loading, "resource_listdir", lambda *__: [])
+
+    first = conf_loading.load_matching_configuration(
+        "*.service.toml", interpret=counting_interpret, cache_dir=Path("/cache")
+    )
+    interpreted_count = len(counting_interpret.seen)
+    second = conf_loading.load_matching_configuration(
+        "*.service.toml", interpret=counting_interpret, cache_dir=Path("/cache")
+    )
+
+    assert interpreted_count > 0
+    assert len(counting_interpret.seen) == interpreted_count
+    assert dict(first) == dict(second)
+
+
+@pytest.mark.usefixtures("mock_config_file_stubs")
+def test_load_configuration_detects_changes(
+    monkeypatch, mock_xdg_config_home, counting_interpret
+):
+    """Modified configuration files invalidate the cache."""
+
+    monkeypatch.setattr(conf_loading, "resource_listdir", lambda *__: [])
+
+    conf_loading.load_matching_configuration(
+        "*.service.toml", interpret=counting_interpret, cache_dir=Path("/cache")
+    )
+
+    changed = Path(mock_xdg_config_home, RESOURCE_ID, "user.service.toml")
+    changed.write_text("CHANGED SERVICE", encoding="utf-8")
+
+    result = conf_loading.load_matching_configuration(
+        "*.service.toml", interpret=counting_interpret, cache_dir=Path("/cache")
+    )
+
+    assert "CHANGED SERVICE" in result.values()
+
+
+@pytest.mark.usefixtures("mock_config_file_stubs")
+def test_load_configuration_replaces_outdated_cache(
+    monkeypatch, mock_xdg_config_home, counting_interpret
+):
+    """Changed configuration overwrites the cache instead of adding to it."""
+
+    monkeypatch.setattr(conf_loading, "resource_listdir", lambda *__: [])
+
+    conf_loading.load_matching_configuration(
+        "*.service.toml", interpret=counting_interpret, cache_dir=Path("/cache")
+    )
+
+    changed = Path(mock_xdg_config_home, RESOURCE_ID, "user.service.toml")
+    changed.write_text("CHANGED SERVICE", encoding="utf-8")
+
+    conf_loading.load_matching_configuration(
+        "*.service.toml", interpret=counting_interpret, cache_dir=Path("/cache")
+    )
+
+    assert len(list(Path("/cache").iterdir())) == 1
+
+
+def test_load_configuration_caches_inline_tables(monkeypatch, mock_xdg_config_home, fs):
+    """Inline tables from the toml package are cached without errors."""
+
+    toml = pytest.importorskip("toml")
+    monkeypatch.setattr(conf_loading, "parse_toml", toml.loads)
+    monkeypatch.setattr(conf_loading, "resource_listdir", lambda *__: [])
+
+    service_path = Path(mock_xdg_config_home, RESOURCE_ID, "test.service.toml")
+    fs.create_file(
+        str(service_path),
+        contents='[test]\nrepo_configs = [{name = "x", baseurl = "y"}]\n',
+        encoding="utf-8",
+    )
+    expected = {"test": {"repo_configs": [{"name": "x", "baseurl": "y"}]}}
+
+    first = conf_loading.load_matching_configuration(
+        "*.service.toml", cache_dir=Path("/cache")
+    )
+    second = conf_loading.load_matching_configuration(
+        "*.service.toml", cache_dir=Path("/cache")
+    )
+
+    assert first == second == expected
+    # The cache was written, and no temporary files were left behind
+    cache_files = list(Path("/cache").iterdir())
+    assert len(cache_files) == 1
+    assert cache_files[0].suffix == ".pickle"
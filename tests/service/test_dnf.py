@@ -70,7 +70,7 @@ def test_packages_are_downloaded(configured_group, minimal_srpm_path, tmpdir_fac
     target_dir = Path(str(tmpdir_factory.mktemp("dnf-download")))
     request = rpm.LocalPackage(minimal_srpm_path)
 
-    result = configured_group.download(request, target_dir)
+    result = configured_group.download(request.metadata, target_dir)
 
     assert result
     assert result.path.relative_to(target_dir)
@@ -12,7 +12,6 @@ from textwrap import dedent
 import attr
 import koji as _koji
 import pytest
-from pytrie import StringTrie
 from ruamel import yaml
 
 from rpmrh import rpm
@@ -85,7 +84,7 @@ class MockMutableRepo:
 
     @content.default
     def initial_tags(self):
-        return {"build_tag": StringTrie(), "test_tag": StringTrie()}
+        return {"build_tag": {}, "test_tag": {}}
 
     @property
     def _existing_packages(self) -> frozenset:
@@ -317,6 +316,26 @@ def test_built_package_from_metadata(built_package, service):
     assert fetched.id == built_package.id
 
 
+def test_built_package_from_metadata_is_cached(built_package, service, mocker):
+    """Repeated requests for the same build are answered without the service."""
+
+    get_build = mocker.patch.object(
+        service.session, "getBuild", return_value=attr.asdict(built_package)
+    )
+    metadata = rpm.Metadata(
+        name=built_package.name,
+        version=built_package.version,
+        release=built_package.release,
+        arch=built_package.arch,
+    )
+
+    first = koji.BuiltPackage.from_metadata(service=service, original=metadata)
+    second = koji.BuiltPackage.from_metadata(service=service, original=metadata)
+
+    assert first is second
+    assert get_build.call_count == 1
+
+
 def test_service_from_profile_name(configuration_file):
     """Ensure that the koji configuration can be loaded from file."""
 
@@ -444,3 +463,21 @@ def test_existing_build_can_be_tagged(mutable_repo_service, built_package):
     state = mutable_repo_service.session.content
 
     assert built_package.name in state["test_tag"]
+
+
+def test_task_watching_backs_off(mutable_repo_service, built_package, mocker):
+    """Running task is polled more often at first, then less frequently"""
+
+    open_state, closed_state = _koji.TASK_STATES["OPEN"], _koji.TASK_STATES["CLOSED"]
+    state_seq = [open_state] * 5 + [closed_state]
+    mocker.patch.object(
+        MockMutableRepo,
+        "getTaskInfo",
+        side_effect=[{"id": 42, "state": state} for state in state_seq],
+    )
+    sleep = mocker.patch.object(koji.time, "sleep")
+
+    mutable_repo_service.tag_build("test_tag", built_package, owner="testuser")
+
+    interval_list = [call_args[0][0] for call_args in sleep.call_args_list]
+    assert interval_list == [1, 1.5, 2.25, 3, 3]
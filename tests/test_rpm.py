@@ -1,4 +1,5 @@
 """Test the rpmrh.rpm module."""
+import pickle
 import sys
 from types import MappingProxyType
 
@@ -145,6 +146,33 @@ def test_construction_from_file_name(nevra):
     assert rpm.Metadata.from_nevra(nevra) == rpm.Metadata.from_nevra(filename)
 
 
+@pytest.mark.parametrize(
+    "nevra", ["1:rpmrh-0.1.0-1.fc26.x86_64", "rpmrh-1:0.1.0-1.fc26.x86_64"]
+)
+def test_epoch_accepted_positions(nevra):
+    """Epoch is accepted in front of the name, or in front of the version."""
+
+    metadata = rpm.Metadata.from_nevra(nevra)
+
+    assert (metadata.name, metadata.epoch, metadata.version) == ("rpmrh", 1, "0.1.0")
+
+
+@pytest.mark.parametrize(
+    "nevra",
+    [
+        "rpmrh-0.1.0:1-1.fc26.x86_64",  # after version
+        "rpmrh-0.1.0-1:1.fc26.x86_64",  # in release
+        "rpmrh-0.1.0-1.fc26.x86_64:1",  # after architecture
+        "3:rpmrh-1:0.1.0-1.fc26.x86_64",  # twice
+    ],
+)
+def test_epoch_rejected_elsewhere(nevra):
+    """Epoch in any other position makes the NEVRA invalid."""
+
+    with pytest.raises(ValueError):
+        rpm.Metadata.from_nevra(nevra)
+
+
 def test_construction_from_path(minimal_srpm_path):
     """Metadata can be read for a file path."""
 
@@ -171,3 +199,25 @@ def test_shoten_dist_tag_works(original_nvr, result_nvr):
     result = rpm.shorten_dist_tag(original)
 
     assert result.nvr == result_nvr
+
+
+def test_metadata_fields_exclude_derived_values(metadata):
+    """Only the RPM attributes are reported as fields."""
+
+    assert set(attr.asdict(metadata)) == {
+        "name",
+        "version",
+        "release",
+        "epoch",
+        "arch",
+    }
+
+
+def test_metadata_pickle_recomputes_derived_values(metadata):
+    """Derived values are not pickled, but computed again."""
+
+    restored = pickle.loads(pickle.dumps(metadata))
+
+    assert restored == metadata
+    assert hash(restored) == hash(metadata)
+    assert b"_hash" not in pickle.dumps(metadata)
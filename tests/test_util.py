@@ -35,3 +35,21 @@ def test_system_import_reports_missing_attribute():
 
     with pytest.raises(util.SystemImportError):
         util.system_import("pytest", "raises", "nonexistent_attribute")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_iter_lines_splits_across_chunks(mocker, chunk_size):
+    """Lines are reconstructed regardless of the chunk boundaries"""
+
+    content = "first\r\nsecond\n\nčtvrtý\nlast".encode("utf-8")
+    chunks = [
+        content[start : start + chunk_size]
+        for start in range(0, len(content), chunk_size)
+    ]
+
+    response = mocker.Mock()
+    response.iter_content.return_value = iter(chunks)
+
+    lines = list(util.net.iter_lines(response, chunk_size=chunk_size))
+
+    assert lines == ["first", "second", "", "čtvrtý", "last"]